@@ -20,20 +20,92 @@ Example usage:
 For more details, see the user guide in the docs/ directory.
 """
 
-import importlib.resources
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import os
 import pathlib
+import re
+import shutil
 import subprocess
-from subprocess import CompletedProcess
-from typing import Annotated
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
+
+# Heavier modules (rich, importlib.resources) are imported inside the
+# helpers that need them: a CLI dispatch only pays for what it uses.
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # Define standard directory names
 SRC_DIR = "src"
 TESTS_DIR = "tests"
 TEMPLATES_DIR = "templates"
 
+# Valid project names: lowercase_with_underscores, compiled once at import
+_VALID_PROJECT_NAME = re.compile(r"^[a-z][a-z0-9_]*$")
+
+# How many trailing lines of subprocess output to keep for error context
+_OUTPUT_TAIL_LINES = 200
+
+# Tool paths resolved once at import so each subprocess spawn skips the
+# per-entry $PATH search. Fall back to the bare name when not found, so
+# the error still surfaces at invocation time as before.
+_GIT = shutil.which("git") or "git"
+_UV = shutil.which("uv") or "uv"
+
+
+# Console shared by all commands, created lazily on first use. Tests (or
+# embedders) can swap in their own console by assigning this attribute.
+_DEFAULT_CONSOLE: Console | None = None
+
+
+# Helper function to obtain the console commands print through
+def _get_console() -> Console:
+    """
+    Return the console commands print through.
+
+    rich is imported on first use rather than at module top so that
+    importing the CLI (e.g. for --help or completion) doesn't pay for it.
+
+    Returns:
+        The shared Console, writing to stderr to keep stdout clean for data.
+    """
+    global _DEFAULT_CONSOLE
+    if _DEFAULT_CONSOLE is None:
+        from rich.console import Console
+
+        _DEFAULT_CONSOLE = Console(stderr=True)
+    return _DEFAULT_CONSOLE
+
+
+# Helper function for the commands' directory pre-checks
+def _is_dir(path: pathlib.Path) -> bool:
+    """
+    Check whether a path is an existing directory.
+
+    A module-level seam so tests stub this one function instead of
+    patching is_dir on the global pathlib.Path class, which would also
+    affect every unrelated Path.is_dir() call in the interpreter.
+
+    Args:
+        path: Path to check.
+
+    Returns:
+        True if the path exists and is a directory.
+    """
+    return path.is_dir()
+
+
+# Filesystem call seams, in the same spirit as _is_dir: tests stub these
+# module attributes instead of patching pathlib.Path.mkdir / os.open for
+# the whole interpreter.
+_mkdir = pathlib.Path.mkdir
+_open = os.open
+
 
 # Helper function to create directories
 def _create_directory(path: pathlib.Path, console: Console) -> bool:
@@ -48,18 +120,19 @@ def _create_directory(path: pathlib.Path, console: Console) -> bool:
         True if directory exists or was created successfully, False otherwise
     """
     try:
-        if path.exists():
-            if not path.is_dir():
-                console.print(
-                    f"[bold red]Error:[/bold red] Path '{path}' exists but is not a directory."
-                )
-                return False
-            console.print(f"[yellow]Directory already exists:[/yellow] {path}")
-            return True
-
-        path.mkdir(parents=True, exist_ok=True)
+        # Let mkdir itself detect the already-exists case: one syscall on
+        # the fresh-create path instead of stat + is_dir + mkdir.
+        _mkdir(path, parents=True, exist_ok=False)
         console.print(f"[green]Created directory:[/green] {path}")
         return True
+    except FileExistsError:
+        if path.is_dir():
+            console.print(f"[yellow]Directory already exists:[/yellow] {path}")
+            return True
+        console.print(
+            f"[bold red]Error:[/bold red] Path '{path}' exists but is not a directory."
+        )
+        return False
     except Exception as e:
         console.print(
             f"[bold red]Error:[/bold red] Failed to create directory '{path}': {str(e)}"
@@ -81,16 +154,23 @@ def _create_file(path: pathlib.Path, content: str, console: Console) -> bool:
         True if file exists or was created successfully, False otherwise
     """
     try:
-        if path.exists():
-            console.print(f"[yellow]File already exists:[/yellow] {path}")
-            return True
-
         # Ensure parent directory exists
-        if path.parent.exists() or _create_directory(path.parent, console):
-            path.write_text(content)
-            console.print(f"[green]Created file:[/green] {path}")
-            return True
-        return False
+        if not (path.parent.exists() or _create_directory(path.parent, console)):
+            return False
+
+        # O_EXCL makes the existence check part of the create syscall itself
+        # (no separate stat, no check-then-write race), and writing
+        # pre-encoded bytes skips the text-IO wrapper layers.
+        fd = _open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+        console.print(f"[green]Created file:[/green] {path}")
+        return True
+    except FileExistsError:
+        console.print(f"[yellow]File already exists:[/yellow] {path}")
+        return True
     except Exception as e:
         console.print(
             f"[bold red]Error:[/bold red] Failed to create file '{path}': {str(e)}"
@@ -98,6 +178,72 @@ def _create_file(path: pathlib.Path, content: str, console: Console) -> bool:
         return False
 
 
+# Cached loader for template package data
+@functools.cache
+def _load_templates() -> dict[str, str]:
+    """
+    Load all templates from the package data in one traversal.
+
+    Templates are read-only package data, so the whole directory is read
+    once and cached for the lifetime of the process: a single
+    importlib.resources resolution and directory walk serves every
+    template, instead of one lookup per file.
+
+    Returns:
+        A mapping of template file name to its content.
+
+    Raises:
+        FileNotFoundError: If the templates directory does not exist.
+        ImportError: If the package data cannot be resolved.
+    """
+    import importlib.resources
+
+    resources = importlib.resources.files("project_starter")
+    templates_path = resources / TEMPLATES_DIR
+    return {entry.name: entry.read_text() for entry in templates_path.iterdir()}
+
+
+# Cached compiler from template text to a specialized renderer
+@functools.cache
+def _compile_template(template_content: str) -> Callable[[str, str], str]:
+    """
+    Compile template text into a renderer specialized for its fields.
+
+    string.Formatter parses the format string once, here; the returned
+    callable renders by joining the precomputed segments, so repeated
+    invocations never re-enter the format-string parser. A template with
+    no fields compiles to a constant function. Keying the cache on the
+    content string is free in practice: the argument is the interned
+    object held by the template cache.
+
+    Args:
+        template_content: Raw template text using str.format-style fields.
+
+    Returns:
+        A callable mapping (project_name, package_name) to rendered text.
+    """
+    import string
+
+    if "{" not in template_content:
+        return lambda _project_name, _package_name: template_content
+
+    pieces = [
+        (literal, field)
+        for literal, field, _spec, _conv in string.Formatter().parse(template_content)
+    ]
+
+    def render(project_name: str, package_name: str) -> str:
+        values = {"project_name": project_name, "package_name": package_name}
+        parts: list[str] = []
+        for literal, field in pieces:
+            parts.append(literal)
+            if field:
+                parts.append(values[field])
+        return "".join(parts)
+
+    return render
+
+
 # Helper function to read template files safely
 def _read_template(template_name: str, console: Console) -> str | None:
     """
@@ -111,14 +257,17 @@ def _read_template(template_name: str, console: Console) -> str | None:
         The content of the template file as a string, or None if an error occurred.
     """
     try:
-        resources = importlib.resources.files("project_starter")
-        template_path = resources / TEMPLATES_DIR / template_name
-        return template_path.read_text()
+        content = _load_templates().get(template_name)
     except (FileNotFoundError, ImportError) as e:
         console.print(
             f"[bold red]Error:[/bold red] Could not read template '{template_name}'. {str(e)}"
         )
         return None
+    if content is None:
+        console.print(
+            f"[bold red]Error:[/bold red] Could not read template '{template_name}'. Template not found"
+        )
+    return content
 
 
 # Helper function to run shell commands
@@ -128,6 +277,12 @@ def _run_command(
     """
     Run a shell command.
 
+    When capturing, the child's combined stdout/stderr is streamed line by
+    line into a bounded buffer instead of being accumulated wholesale, so
+    verbose commands (e.g. dependency installs) cannot pile megabytes of
+    log output into memory. Callers get the most recent lines, which is
+    all they inspect today.
+
     Args:
         command: The command to run as a list of strings.
         cwd: The working directory in which to run the command.
@@ -137,22 +292,319 @@ def _run_command(
     Returns:
         A tuple containing:
         - Boolean indicating if the command succeeded
-        - String containing the command output if capture=True, None otherwise or on error
+        - String containing the tail of the command output if capture=True,
+          None otherwise or if the command could not be started
     """
     try:
         if capture:
-            result: CompletedProcess[str] = subprocess.run(
-                command, cwd=cwd, check=True, text=True, capture_output=True
+            # Read raw bytes and decode once at the end: git and uv emit
+            # UTF-8, and skipping text mode avoids the TextIOWrapper and
+            # its incremental per-read decoding/newline translation.
+            process = subprocess.Popen(
+                command,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+            tail: collections.deque[bytes] = collections.deque(
+                maxlen=_OUTPUT_TAIL_LINES
             )
-            return True, result.stdout
+            if process.stdout is not None:
+                for line in process.stdout:
+                    tail.append(line)
+            returncode = process.wait()
+            output = b"".join(tail).decode("utf-8", "replace")
+            if returncode != 0:
+                console.print(
+                    f"[bold red]Command Error:[/bold red] {' '.join(command)} failed with exit code {returncode}"
+                )
+                return False, output
+            return True, output
 
-        subprocess.run(command, cwd=cwd, check=True, text=True)
+        subprocess.run(command, cwd=cwd, check=True)
         return True, None
-    except subprocess.SubprocessError as e:
+    except (OSError, subprocess.SubprocessError) as e:
         console.print(
             f"[bold red]Command Error:[/bold red] {' '.join(command)} failed with {str(e)}"
         )
+        # CalledProcessError carries any captured output; return it so
+        # callers can tell how far a batched command got before failing.
+        return False, getattr(e, "stdout", None)
+
+
+# Helper function to render a template into its target file
+def _render_and_write(
+    template_name: str,
+    target_path: pathlib.Path,
+    project_name: str,
+    package_name: str,
+    console: Console,
+) -> bool:
+    """
+    Read a template, substitute the project names, and write the result.
+
+    Fusing read, format, and write into one call gives the `new` command a
+    single unit of work per target file, so all templates can be processed
+    concurrently in worker threads.
+
+    Args:
+        template_name: The name of the template file to render.
+        target_path: Path of the file to create.
+        project_name: Name of the project being created.
+        package_name: Name of the package (Python module name).
+        console: Rich console for output.
+
+    Returns:
+        True if the file was rendered and written successfully, False otherwise.
+    """
+    template_content = _read_template(template_name, console)
+    if template_content is None:
+        console.print(
+            f"[bold red]Fatal Error:[/bold red] Cannot proceed without template '{template_name}'."
+        )
+        return False
+
+    content = _compile_template(template_content)(project_name, package_name)
+
+    if not _create_file(target_path, content, console):
+        console.print(
+            f"[bold red]Fatal Error:[/bold red] Failed to create essential file '{target_path}'."
+        )
+        return False
+    return True
+
+
+# Helper function to check whether a repository has uncommitted changes
+def _git_status_porcelain(
+    working_dir: pathlib.Path, console: Console
+) -> tuple[bool, str | None]:
+    """
+    Report whether the repository at working_dir has uncommitted changes.
+
+    Prefers the optional dulwich library, which inspects the repository
+    in-process and avoids a git subprocess spawn; falls back to
+    `git status --porcelain` when dulwich is not installed.
+
+    Args:
+        working_dir: The directory containing the repository to inspect.
+        console: Rich console for output.
+
+    Returns:
+        The same contract as _run_command for `git status --porcelain`:
+        a (succeeded, output) tuple where non-empty output means dirty.
+    """
+    try:
+        from dulwich import porcelain
+        from dulwich.errors import NotGitRepository
+        from dulwich.repo import Repo
+    except ImportError:
+        return _run_command([_GIT, "status", "--porcelain"], working_dir, console)
+
+    try:
+        # Repo.discover walks up to the repository root, matching how
+        # `git status` behaves when run from a subdirectory.
+        with Repo.discover(str(working_dir)) as repo:
+            repo_status = porcelain.status(repo)
+    except NotGitRepository:
         return False, None
+    except Exception:
+        # Anything else dulwich trips over (corrupt repository, permission
+        # problems): degrade to the subprocess path rather than crashing.
+        return _run_command([_GIT, "status", "--porcelain"], working_dir, console)
+    dirty = bool(
+        repo_status.untracked
+        or repo_status.unstaged
+        or any(repo_status.staged.values())
+    )
+    # A stand-in for porcelain output: callers only test for emptiness.
+    return True, "dirty" if dirty else ""
+
+
+# The uv steps run after the project is scaffolded, in dependency order.
+# They are chained through a single shell invocation so the process-creation
+# cost (fork+exec plus interpreter/tool startup) is paid once, not per step.
+# git init is not part of the chain: it only needs the project root to exist,
+# so the `new` command overlaps it with the template file I/O instead.
+_SETUP_STEPS: tuple[tuple[str, str], ...] = (
+    ("uv venv", f'"{_UV}" venv'),
+    ("uv pip install", f'"{_UV}" pip install -e ".[dev]"'),
+)
+
+# The sync steps are chained the same way: one shell invocation covers the
+# pull and the push, halving the process spawns per `sync`.
+_SYNC_STEPS: tuple[tuple[str, str], ...] = (
+    ("git pull", f'"{_GIT}" pull --rebase'),
+    ("git push", f'"{_GIT}" push'),
+)
+
+
+async def _git_init_async(root_path: pathlib.Path, console: Console) -> bool:
+    """
+    Run `git init` as an asyncio subprocess.
+
+    Args:
+        root_path: Root directory of the freshly created project.
+        console: Rich console for output.
+
+    Returns:
+        True if the repository was initialized successfully, False otherwise.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            _GIT,
+            "init",
+            cwd=root_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        await process.communicate()
+        return process.returncode == 0
+    except OSError as e:
+        console.print(
+            f"[bold red]Command Error:[/bold red] git init failed with {str(e)}"
+        )
+        return False
+
+
+def _setup_project_environment(root_path: pathlib.Path, console: Console) -> bool:
+    """
+    Run the post-scaffold uv setup steps (venv creation, dependency install).
+
+    A single `uv sync --all-extras` creates the virtual environment and
+    installs the dependencies declared in pyproject.toml in one uv
+    process. If that fails (e.g. an older uv without project sync
+    support), fall back to `uv venv` + `uv pip install`, batched into one
+    shell command joined with '&&' and with a marker echoed before each
+    step so a failure can be attributed to the step that caused it.
+
+    Args:
+        root_path: Root directory of the freshly created project.
+        console: Rich console for output.
+
+    Returns:
+        True if setup succeeded, False otherwise.
+    """
+    sync_success, _ = _run_command(
+        [_UV, "sync", "--all-extras"], cwd=root_path, console=console
+    )
+    if sync_success:
+        return True
+
+    console.print(
+        "[yellow]Info:[/yellow] 'uv sync' failed; falling back to 'uv venv' + 'uv pip install'."
+    )
+    script = " && ".join(
+        f'echo "::step::{name}" && {command}' for name, command in _SETUP_STEPS
+    )
+    shell = ["cmd", "/c"] if os.name == "nt" else ["sh", "-c"]
+    shell_command = [*shell, script]
+
+    success, output = _run_command(shell_command, cwd=root_path, console=console)
+    if success:
+        return True
+
+    # The last marker present in the combined output is the step that failed.
+    failed_step = _SETUP_STEPS[0][0]
+    for name, _ in _SETUP_STEPS:
+        if output and f"::step::{name}" in output:
+            failed_step = name
+    console.print(
+        f"[yellow]Warning:[/yellow] Setup step '{failed_step}' failed. "
+        f"Please run '{failed_step}' manually inside the project directory."
+    )
+    return False
+
+
+async def _new_async(
+    project_name: str,
+    package_name: str,
+    root_path: pathlib.Path,
+    console: Console,
+) -> None:
+    """
+    Asynchronous body of the `new` command.
+
+    `git init` only needs the project root to exist, so it is started first
+    and overlaps with the directory and template file I/O (run in worker
+    threads). The uv setup steps run last because the dependency install
+    needs the rendered pyproject.toml.
+
+    Args:
+        project_name: Name of the project being created.
+        package_name: Name of the package (Python module name).
+        root_path: Root directory of the freshly created project.
+        console: Rich console for output.
+
+    Raises:
+        typer.Exit: If an essential directory, file, or setup step fails.
+    """
+    git_task = asyncio.create_task(_git_init_async(root_path, console))
+
+    # --- Create Standard Subdirectories ---
+    src_path = root_path / SRC_DIR / package_name
+    tests_path = root_path / TESTS_DIR
+
+    src_ok, tests_ok = await asyncio.gather(
+        asyncio.to_thread(_create_directory, src_path, console),
+        asyncio.to_thread(_create_directory, tests_path, console),
+    )
+    if not src_ok:
+        # Consider cleanup logic for root_path if subdirs fail
+        raise typer.Exit(code=1)
+    if not tests_ok:
+        console.print(
+            f"[yellow]Warning:[/yellow] Failed to create '{tests_path}', continuing without tests directory."
+        )
+        # Decide if this is fatal or not - for now, continue
+
+    # --- Create Essential Files (one worker thread per file) ---
+    init_py_path = src_path / "__init__.py"
+    tests_init_path = tests_path / "__init__.py"
+    template_files_to_create = {
+        "_gitignore.template": root_path / ".gitignore",
+        "_readme.md.template": root_path / "README.md",
+        "_pyproject.toml.template": root_path / "pyproject.toml",
+    }
+
+    init_ok, tests_init_ok, *template_results = await asyncio.gather(
+        asyncio.to_thread(_create_file, init_py_path, "", console),
+        asyncio.to_thread(_create_file, tests_init_path, "", console),
+        *(
+            asyncio.to_thread(
+                _render_and_write,
+                template_name,
+                target_path,
+                project_name,
+                package_name,
+                console,
+            )
+            for template_name, target_path in template_files_to_create.items()
+        ),
+    )
+    if not init_ok:
+        console.print(
+            f"[bold red]Fatal Error:[/bold red] Failed to create essential file '{init_py_path}'."
+        )
+        # Consider cleanup
+        raise typer.Exit(code=1)
+    if not tests_init_ok:
+        console.print(
+            "[bold red]Warning:[/bold red] Failed to create tests __init__.py file."
+        )
+        # Not fatal, continue
+    if not all(template_results):
+        # _render_and_write has already reported which file failed
+        raise typer.Exit(code=1)
+
+    # --- Initialize Git and Set Up Virtual Environment ---
+    console.print("\n--- Initializing Git and setting up environment (uv) ---")
+    if not await git_task:
+        console.print(
+            "[yellow]Warning:[/yellow] Failed to initialize Git repository. Please run 'git init' manually."
+        )
+    # TODO: Add initial commit automatically?
+    if not await asyncio.to_thread(_setup_project_environment, root_path, console):
+        raise typer.Exit(code=1)
 
 
 app = typer.Typer(
@@ -198,7 +650,7 @@ def new(
         `pps new my_cool_project`
         `pps new data_analysis_tool --dir ~/Projects`
     """
-    if " " in project_name or project_name.lower() != project_name:
+    if not _VALID_PROJECT_NAME.fullmatch(project_name):
         typer.echo(
             f"Error: Project name '{project_name}' should be lowercase with underscores.",
             err=True,
@@ -210,7 +662,7 @@ def new(
         target_dir = pathlib.Path.cwd()
 
     # Determine the root directory for the new project
-    if not target_dir.is_dir():
+    if not _is_dir(target_dir):
         typer.echo(
             f"Error: Specified target directory does not exist: {target_dir}",
             err=True,
@@ -218,93 +670,16 @@ def new(
         raise typer.Exit(code=1)
     root_path = target_dir.resolve() / project_name
 
-    # Use Console() directly instead of typer.rich_utils
-    console = Console(stderr=True)
+    console = _get_console()
     console.print(f"Initializing new project: '{project_name}' in '{root_path}'")
 
     # --- Create Root Directory ---
     if not _create_directory(root_path, console):
         raise typer.Exit(code=1)
 
-    # --- Create Standard Subdirectories ---
+    # --- Scaffold and Set Up (async: git init overlaps the file I/O) ---
     package_name = project_name  # Assuming project_name is already sanitized (lowercase_with_underscores)
-    src_path = root_path / SRC_DIR / package_name
-    tests_path = root_path / TESTS_DIR
-
-    if not _create_directory(src_path, console):
-        # Consider cleanup logic for root_path if subdirs fail
-        raise typer.Exit(code=1)
-    if not _create_directory(tests_path, console):
-        console.print(
-            f"[yellow]Warning:[/yellow] Failed to create '{tests_path}', continuing without tests directory."
-        )
-        # Decide if this is fatal or not - for now, continue
-
-    # --- Create Essential Files ---
-    # Create __init__.py first
-    init_py_path = src_path / "__init__.py"
-    if not _create_file(init_py_path, "", console):
-        console.print(
-            f"[bold red]Fatal Error:[/bold red] Failed to create essential file '{init_py_path}'."
-        )
-        # Consider cleanup
-        raise typer.Exit(code=1)
-
-    # Now create files from templates
-    template_files_to_create = {
-        "_gitignore.template": root_path / ".gitignore",
-        "_readme.md.template": root_path / "README.md",
-        "_pyproject.toml.template": root_path / "pyproject.toml",
-    }
-
-    for template_name, target_path in template_files_to_create.items():
-        template_content = _read_template(template_name, console)
-        if template_content is None:
-            console.print(
-                f"[bold red]Fatal Error:[/bold red] Cannot proceed without template '{template_name}'."
-            )
-            # Consider cleanup
-            raise typer.Exit(code=1)
-
-        content = template_content.format(
-            project_name=project_name, package_name=package_name
-        )
-
-        if not _create_file(target_path, content, console):
-            console.print(
-                f"[bold red]Fatal Error:[/bold red] Failed to create essential file '{target_path}'."
-            )
-            # Consider cleanup
-            raise typer.Exit(code=1)
-
-    # --- Initialize Git ---
-    console.print("\n--- Initializing Git Repository ---")
-    git_init_success, _ = _run_command(["git", "init"], cwd=root_path, console=console)
-    if not git_init_success:
-        console.print(
-            "[yellow]Warning:[/yellow] Failed to initialize Git repository. Please run 'git init' manually."
-        )
-    # TODO: Add initial commit automatically?
-
-    # --- Set up Virtual Environment ---
-    console.print("\n--- Setting up Virtual Environment (uv) ---")
-    uv_venv_success, _ = _run_command(["uv", "venv"], cwd=root_path, console=console)
-    if not uv_venv_success:
-        console.print(
-            "[yellow]Warning:[/yellow] Failed to create virtual environment with uv. Please run 'uv venv' manually."
-        )
-        # Exiting here might be safer if venv fails
-        raise typer.Exit(code=1)
-
-    # Attempt to install dev dependencies only if venv creation succeeded
-    console.print("\n--- Installing Development Dependencies (uv) ---")
-    uv_sync_success, _ = _run_command(
-        ["uv", "pip", "install", "-e", ".[dev]"], cwd=root_path, console=console
-    )
-    if not uv_sync_success:
-        console.print(
-            "[yellow]Warning:[/yellow] Failed to install dev dependencies with uv. Please run 'uv pip install -e \".[dev]\"' manually after activating the environment."
-        )
+    asyncio.run(_new_async(project_name, package_name, root_path, console))
 
     # --- Final Success Message ---
     console.print(
@@ -340,11 +715,11 @@ def save(
         `pps save -m "Add user authentication feature"`
         `pps save -m "Fix bug in data processing"`
     """
-    console = Console(stderr=True)
+    console = _get_console()
     project_dir = pathlib.Path.cwd()
 
     # Basic check: Does a .git directory exist here?
-    if not (project_dir / ".git").is_dir():
+    if not _is_dir(project_dir / ".git"):
         console.print(
             f"[red]Error:[/red] No Git repository found at '{project_dir}'. Are you inside the project directory?"
         )
@@ -352,19 +727,30 @@ def save(
 
     console.print(f"Saving project state in '{project_dir}'...")
 
-    # Step 1: Stage all changes
-    console.print("--- Staging all changes (git add .) ---")
-    add_success, _ = _run_command(["git", "add", "."], cwd=project_dir, console=console)
-    if not add_success:
-        console.print(
-            "[red]Error:[/red] Failed to stage changes. Check Git output above."
+    # Step 1: Stage new files, but only when any exist. Tracked-file
+    # changes are staged by `git commit -a` itself, so the common case
+    # (no new files) needs a single staging-and-committing git call.
+    untracked_success, untracked = _run_command(
+        [_GIT, "ls-files", "--others", "--exclude-standard"],
+        cwd=project_dir,
+        console=console,
+    )
+    if not untracked_success or (untracked and untracked.strip()):
+        # Stage everything, also covering the case where the check failed.
+        console.print("--- Staging all changes (git add .) ---")
+        add_success, _ = _run_command(
+            [_GIT, "add", "."], cwd=project_dir, console=console
         )
-        raise typer.Exit(code=1)
+        if not add_success:
+            console.print(
+                "[red]Error:[/red] Failed to stage changes. Check Git output above."
+            )
+            raise typer.Exit(code=1)
 
-    # Step 2: Commit changes
-    console.print(f'--- Committing changes (git commit -m "{message}") ---')
+    # Step 2: Stage tracked changes and commit in one git invocation
+    console.print(f'--- Committing changes (git commit -a -m "{message}") ---')
     commit_success, commit_stdout = _run_command(
-        ["git", "commit", "-m", message], cwd=project_dir, console=console
+        [_GIT, "commit", "-a", "-m", message], cwd=project_dir, console=console
     )
     if not commit_success:
         # Check if commit failed because nothing changed
@@ -406,11 +792,11 @@ def sync() -> None:
         - If you haven't set up a remote repository, this will fail
         - If there are merge conflicts, you'll need to resolve them manually
     """
-    console = Console(stderr=True)
+    console = _get_console()
     project_dir = pathlib.Path.cwd()
 
     # Basic check: Does a .git directory exist here?
-    if not (project_dir / ".git").is_dir():
+    if not _is_dir(project_dir / ".git"):
         console.print(
             f"[red]Error:[/red] No Git repository found at '{project_dir}'. Are you inside the project directory?"
         )
@@ -418,36 +804,36 @@ def sync() -> None:
 
     console.print(f"Syncing project state in '{project_dir}' with remote...")
 
-    # Step 1: Pull changes
-    console.print("--- Pulling changes from remote (git pull) ---")
-    pull_success, _ = _run_command(["git", "pull"], cwd=project_dir, console=console)
-    if not pull_success:
+    # Pull and push in one shell invocation, with a marker echoed before
+    # each step so a failure can be attributed to pull or push.
+    console.print("--- Syncing with remote (git pull + git push) ---")
+    script = " && ".join(
+        f'echo "::step::{name}" && {command}' for name, command in _SYNC_STEPS
+    )
+    shell = ["cmd", "/c"] if os.name == "nt" else ["sh", "-c"]
+    success, output = _run_command([*shell, script], cwd=project_dir, console=console)
+    if success:
+        console.print(
+            "\n[bold green]Successfully synced project with remote.[/bold green]"
+        )
+        return
+
+    if not (output and f"::step::{_SYNC_STEPS[1][0]}" in output):
         console.print(
             "[red]Error:[/red] Failed to pull changes from remote. Check Git output above. (Is remote configured? Conflicts?)"
         )
         raise typer.Exit(code=1)
 
-    # Step 2: Push changes
-    console.print("--- Pushing local changes to remote (git push) ---")
-    push_success, push_stdout = _run_command(
-        ["git", "push"], cwd=project_dir, console=console
-    )
-    if not push_success:
-        # Check if push failed because already up-to-date
-        # Note: stderr often contains 'Everything up-to-date' for push
-        # We capture stderr in _run_command now, but didn't return it. Let's adjust _run_command or check stdout.
-        # For now, let's assume stdout might contain info for some git versions/configs
-        if push_stdout and "Everything up-to-date" in push_stdout:
-            console.print("[yellow]Info:[/yellow] No local changes to push.")
-        else:
-            console.print(
-                "[red]Error:[/red] Failed to push changes to remote. Check Git output above. (Is remote configured? New branch?)"
-            )
-            raise typer.Exit(code=1)
+    # Check if push failed because already up-to-date
+    # Note: stderr often contains 'Everything up-to-date' for push, and
+    # _run_command merges stderr into the captured output.
+    if "Everything up-to-date" in output:
+        console.print("[yellow]Info:[/yellow] No local changes to push.")
     else:
         console.print(
-            "\n[bold green]Successfully synced project with remote.[/bold green]"
+            "[red]Error:[/red] Failed to push changes to remote. Check Git output above. (Is remote configured? New branch?)"
         )
+        raise typer.Exit(code=1)
 
 
 @app.command()
@@ -484,15 +870,13 @@ def status(
     if working_dir is None:
         working_dir = pathlib.Path.cwd()
 
-    console = Console(stderr=True)
+    console = _get_console()
     console.print("[bold blue]Checking project status...[/bold blue]")
 
     project_name = working_dir.name
 
     # Check if git is initialized
-    success, git_status = _run_command(
-        ["git", "status", "--porcelain"], working_dir, console
-    )
+    success, git_status = _git_status_porcelain(working_dir, console)
 
     if success:
         if git_status and git_status.strip():
@@ -502,30 +886,40 @@ def status(
     else:
         console.print("[red]Git:[/red] Not a git repository or git not installed.")
 
-    # Check project structure
-    src_path = working_dir / SRC_DIR
-    tests_path = working_dir / TESTS_DIR
+    # Check project structure and essential files with a single directory
+    # scan; membership tests on the result replace one stat() per path.
+    try:
+        top_level = {entry.name: entry for entry in os.scandir(working_dir)}
+    except OSError:
+        top_level = {}
 
     package_name = project_name.replace("-", "_").lower()
-    package_path = src_path / package_name
 
-    if not src_path.exists():
+    src_entry = top_level.get(SRC_DIR)
+    if src_entry is None or not src_entry.is_dir():
         console.print(f"[red]Structure:[/red] Missing source directory ({SRC_DIR}/).")
-    elif not package_path.exists():
-        console.print(
-            f"[red]Structure:[/red] Missing package directory ({SRC_DIR}/{package_name}/)."
-        )
     else:
-        console.print(
-            "[green]Structure:[/green] Source directory structure looks good."
-        )
+        package_found = False
+        with os.scandir(working_dir / SRC_DIR) as src_entries:
+            for entry in src_entries:
+                if entry.name == package_name and entry.is_dir():
+                    package_found = True
+                    break
+        if package_found:
+            console.print(
+                "[green]Structure:[/green] Source directory structure looks good."
+            )
+        else:
+            console.print(
+                f"[red]Structure:[/red] Missing package directory ({SRC_DIR}/{package_name}/)."
+            )
 
-    if not tests_path.exists():
+    if TESTS_DIR in top_level:
+        console.print("[green]Structure:[/green] Tests directory exists.")
+    else:
         console.print(
             f"[yellow]Structure:[/yellow] Missing tests directory ({TESTS_DIR}/)."
         )
-    else:
-        console.print("[green]Structure:[/green] Tests directory exists.")
 
     # Check for essential files
     essential_files = [
@@ -534,7 +928,7 @@ def status(
         ".gitignore",
     ]
 
-    missing_files = [f for f in essential_files if not (working_dir / f).exists()]
+    missing_files = [f for f in essential_files if f not in top_level]
 
     if missing_files:
         console.print(
@@ -544,83 +938,5 @@ def status(
         console.print("[green]Files:[/green] All essential files exist.")
 
 
-def _create_project_structure(
-    root_path: pathlib.Path,
-    project_name: str,
-    package_name: str,
-    console: Console,
-) -> bool:
-    """
-    Create the project directory structure.
-
-    Args:
-        root_path: Path to the project root
-        project_name: Name of the project
-        package_name: Name of the package (Python module name)
-        console: Rich console for output
-
-    Returns:
-        True if successful, False otherwise
-    """
-    # Create main directories
-    src_path = root_path / SRC_DIR
-    tests_path = root_path / TESTS_DIR
-    package_path = src_path / package_name
-
-    directories_to_create = [
-        src_path,
-        package_path,
-        tests_path,
-    ]
-
-    for dir_path in directories_to_create:
-        if not _create_directory(dir_path, console):
-            return False
-
-    # --- Create Essential Files ---
-    # Create __init__.py first
-    init_py_path = package_path / "__init__.py"
-    if not _create_file(init_py_path, "", console):
-        console.print(
-            f"[bold red]Fatal Error:[/bold red] Failed to create essential file '{init_py_path}'."
-        )
-        return False
-
-    # Initialize tests directory with empty __init__.py
-    test_init_path = tests_path / "__init__.py"
-    if not _create_file(test_init_path, "", console):
-        console.print(
-            "[bold red]Warning:[/bold red] Failed to create tests __init__.py file."
-        )
-        # Not fatal, continue
-
-    # Now create files from templates
-    template_files_to_create = {
-        "_gitignore.template": root_path / ".gitignore",
-        "_readme.md.template": root_path / "README.md",
-        "_pyproject.toml.template": root_path / "pyproject.toml",
-    }
-
-    for template_name, target_path in template_files_to_create.items():
-        template_content = _read_template(template_name, console)
-        if template_content is None:
-            console.print(
-                f"[bold red]Fatal Error:[/bold red] Cannot proceed without template '{template_name}'."
-            )
-            return False
-
-        content = template_content.format(
-            project_name=project_name, package_name=package_name
-        )
-
-        if not _create_file(target_path, content, console):
-            console.print(
-                f"[bold red]Fatal Error:[/bold red] Failed to create essential file '{target_path}'."
-            )
-            return False
-
-    return True
-
-
 if __name__ == "__main__":
     app()
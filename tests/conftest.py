@@ -0,0 +1,97 @@
+"""
+Shared fixtures for the project_starter test suite.
+"""
+
+import functools
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import typer.testing
+from rich.console import Console
+
+from project_starter import main
+
+# The Typer->Click conversion walks every command and option, and this typer
+# release's CliRunner.invoke re-runs it on each call (it only accepts a Typer
+# app, not a pre-built Click command). Memoize the conversion here so the walk
+# happens once per app across every test module that invokes the CLI.
+typer.testing._get_command = functools.cache(typer.testing._get_command)  # noqa: SLF001
+
+
+class FakeConsole:
+    """
+    Minimal stand-in for rich.console.Console that records print() calls.
+
+    Much cheaper to build than MagicMock(spec=Console), which introspects
+    the full Console attribute surface on every construction.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def print(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+    @property
+    def messages(self):
+        """The first positional argument of each print() call, in order."""
+        return [args[0] for args, _kwargs in self.calls if args]
+
+
+@pytest.fixture(scope="class")
+def shared_tmp(tmp_path_factory):
+    """
+    One temporary directory per test class.
+
+    For tests that only need an existing path and never write into it
+    (the helpers they would write through are mocked), this skips the
+    per-test directory creation and cleanup that tmp_path performs.
+    """
+    return tmp_path_factory.mktemp("cli")
+
+
+@pytest.fixture
+def console():
+    """A recording console stub for tests that call helpers directly."""
+    return FakeConsole()
+
+
+@pytest.fixture(autouse=True)
+def quiet_console(monkeypatch):
+    """
+    Route all command output into an in-memory buffer.
+
+    Swapping the module-level default console beats patching the
+    rich.console.Console constructor: no mock machinery on a hot-path
+    class, and each test gets an isolated buffer it can inspect.
+    """
+    console = Console(file=io.StringIO(), force_terminal=False)
+    monkeypatch.setattr(main, "_DEFAULT_CONSOLE", console)
+    return console
+
+
+@pytest.fixture
+def mocked_main(monkeypatch):
+    """
+    Replace the main-module helper functions with pre-configured MagicMocks.
+
+    Returns a namespace exposing the mocks, so tests tune return values or
+    side effects on ready objects instead of stacking patch() context
+    managers (each of which builds a patcher and re-walks the dotted path
+    on entry).
+    """
+    mocks = SimpleNamespace(
+        create_directory=MagicMock(return_value=True),
+        create_file=MagicMock(return_value=True),
+        read_template=MagicMock(return_value="template content"),
+        run_command=MagicMock(return_value=(True, "")),
+        git_init=AsyncMock(return_value=True),
+    )
+    monkeypatch.setattr(main, "_create_directory", mocks.create_directory)
+    monkeypatch.setattr(main, "_create_file", mocks.create_file)
+    monkeypatch.setattr(main, "_read_template", mocks.read_template)
+    monkeypatch.setattr(main, "_run_command", mocks.run_command)
+    monkeypatch.setattr(main, "_git_init_async", mocks.git_init)
+    return mocks
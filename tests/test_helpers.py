@@ -5,128 +5,117 @@ Tests for helper functions in project_starter.main module.
 import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+from project_starter import main
 from project_starter.main import (
     _create_directory,
     _create_file,
+    _git_status_porcelain,
+    _load_templates,
     _read_template,
     _run_command,
 )
-from rich.console import Console
 
 
-class TestCreateDirectory:
-    """Tests for the _create_directory function."""
+def _raise_permission_error(*_args, **_kwargs):
+    """Stand-in for a filesystem seam that fails with PermissionError."""
+    raise PermissionError("Permission denied")
 
-    def test_create_new_directory(self, tmp_path):
-        """Test creating a new directory."""
-        # Arrange
-        test_dir = tmp_path / "new_dir"
-        console = MagicMock(spec=Console)
-
-        # Act
-        result = _create_directory(test_dir, console)
 
-        # Assert
-        assert result is True
-        assert test_dir.exists()
-        assert test_dir.is_dir()
-        console.print.assert_called_with(
-            f"[green]Created directory:[/green] {test_dir}"
-        )
+class TestCreateDirectory:
+    """Tests for the _create_directory function."""
 
-    def test_directory_already_exists(self, tmp_path):
-        """Test when directory already exists."""
+    @pytest.mark.parametrize(
+        ("setup", "expected", "message_template"),
+        [
+            # fresh path: created and reported
+            ("new", True, "[green]Created directory:[/green] {path}"),
+            # directory already present: treated as success
+            ("existing_dir", True, "[yellow]Directory already exists:[/yellow] {path}"),
+            # path occupied by a file: failure
+            (
+                "existing_file",
+                False,
+                "[bold red]Error:[/bold red] Path '{path}' exists but is not a directory.",
+            ),
+            # mkdir raises: failure with the underlying reason
+            (
+                "perm_error",
+                False,
+                "[bold red]Error:[/bold red] Failed to create directory '{path}': Permission denied",
+            ),
+        ],
+        ids=["new", "existing_dir", "existing_file", "perm_error"],
+    )
+    def test_create_directory(
+        self, tmp_path, console, monkeypatch, setup, expected, message_template
+    ):
+        """Test directory creation for each pre-existing state of the path."""
         # Arrange
-        test_dir = tmp_path / "existing_dir"
-        test_dir.mkdir()
-        console = MagicMock(spec=Console)
+        test_dir = tmp_path / "target"
+        if setup == "existing_dir":
+            test_dir.mkdir()
+        elif setup == "existing_file":
+            test_dir.write_text("test content")
+        elif setup == "perm_error":
+            monkeypatch.setattr(main, "_mkdir", _raise_permission_error)
 
         # Act
         result = _create_directory(test_dir, console)
 
         # Assert
-        assert result is True
-        console.print.assert_called_with(
-            f"[yellow]Directory already exists:[/yellow] {test_dir}"
-        )
-
-    def test_path_exists_but_not_directory(self, tmp_path):
-        """Test when path exists but is not a directory."""
-        # Arrange
-        test_file = tmp_path / "existing_file"
-        test_file.write_text("test content")
-        console = MagicMock(spec=Console)
-
-        # Act
-        result = _create_directory(test_file, console)
-
-        # Assert
-        assert result is False
-        console.print.assert_called_with(
-            f"[bold red]Error:[/bold red] Path '{test_file}' exists but is not a directory."
-        )
-
-    def test_permission_error(self, tmp_path):
-        """Test when permission error occurs."""
-        # Arrange
-        console = MagicMock(spec=Console)
-        test_dir = tmp_path / "no_perm_dir"
-
-        # Act & Assert
-        with patch(
-            "pathlib.Path.mkdir", side_effect=PermissionError("Permission denied")
-        ):
-            result = _create_directory(test_dir, console)
-            assert result is False
-            console.print.assert_called_with(
-                f"[bold red]Error:[/bold red] Failed to create directory '{test_dir}': Permission denied"
-            )
+        assert result is expected
+        if setup == "new":
+            assert test_dir.is_dir()
+        assert console.messages[-1] == message_template.format(path=test_dir)
 
 
 class TestCreateFile:
     """Tests for the _create_file function."""
 
-    def test_create_new_file(self, tmp_path):
-        """Test creating a new file."""
-        # Arrange
-        test_file = tmp_path / "new_file.txt"
-        content = "Test content"
-        console = MagicMock(spec=Console)
-
-        # Act
-        result = _create_file(test_file, content, console)
-
-        # Assert
-        assert result is True
-        assert test_file.exists()
-        assert test_file.read_text() == content
-        console.print.assert_called_with(f"[green]Created file:[/green] {test_file}")
-
-    def test_file_already_exists(self, tmp_path):
-        """Test when file already exists."""
+    @pytest.mark.parametrize(
+        ("setup", "expected", "message_template"),
+        [
+            # fresh path: created with the given content
+            ("new", True, "[green]Created file:[/green] {path}"),
+            # file already present: success, content left untouched
+            ("existing_file", True, "[yellow]File already exists:[/yellow] {path}"),
+            # os.open raises: failure with the underlying reason
+            (
+                "perm_error",
+                False,
+                "[bold red]Error:[/bold red] Failed to create file '{path}': Permission denied",
+            ),
+        ],
+        ids=["new", "existing_file", "perm_error"],
+    )
+    def test_create_file(
+        self, tmp_path, console, monkeypatch, setup, expected, message_template
+    ):
+        """Test file creation for each pre-existing state of the path."""
         # Arrange
-        test_file = tmp_path / "existing_file.txt"
-        test_file.write_text("existing content")
-        console = MagicMock(spec=Console)
+        test_file = tmp_path / "target.txt"
+        if setup == "existing_file":
+            test_file.write_text("existing content")
+        elif setup == "perm_error":
+            monkeypatch.setattr(main, "_open", _raise_permission_error)
 
         # Act
         result = _create_file(test_file, "new content", console)
 
         # Assert
-        assert result is True
-        assert (
-            test_file.read_text() == "existing content"
-        )  # Content should not be changed
-        console.print.assert_called_with(
-            f"[yellow]File already exists:[/yellow] {test_file}"
-        )
-
-    def test_parent_directory_creation(self, tmp_path):
+        assert result is expected
+        if setup == "new":
+            assert test_file.read_text() == "new content"
+        elif setup == "existing_file":
+            assert test_file.read_text() == "existing content"  # not overwritten
+        assert console.messages[-1] == message_template.format(path=test_file)
+
+    def test_parent_directory_creation(self, tmp_path, console):
         """Test creating parent directories if they don't exist."""
         # Arrange
         nested_file = tmp_path / "nested" / "dir" / "new_file.txt"
         content = "Test content"
-        console = MagicMock(spec=Console)
 
         # Act
         with patch("project_starter.main._create_directory") as mock_create_dir:
@@ -137,12 +126,11 @@ class TestCreateFile:
         assert mock_create_dir.called
         assert mock_create_dir.return_value is True
 
-    def test_parent_directory_creation_failure(self, tmp_path):
+    def test_parent_directory_creation_failure(self, tmp_path, console):
         """Test handling failure to create parent directory."""
         # Arrange
         nested_file = tmp_path / "nested" / "dir" / "new_file.txt"
         content = "Test content"
-        console = MagicMock(spec=Console)
 
         # Act
         with patch("project_starter.main._create_directory") as mock_create_dir:
@@ -153,99 +141,190 @@ class TestCreateFile:
         assert result is False
         mock_create_dir.assert_called_once()
 
-    def test_permission_error(self, tmp_path):
-        """Test when permission error occurs."""
-        # Arrange
-        test_file = tmp_path / "no_perm_file.txt"
-        console = MagicMock(spec=Console)
-
-        # Act & Assert
-        with patch(
-            "pathlib.Path.write_text", side_effect=PermissionError("Permission denied")
-        ):
-            result = _create_file(test_file, "content", console)
-            assert result is False
-            console.print.assert_called_with(
-                f"[bold red]Error:[/bold red] Failed to create file '{test_file}': Permission denied"
-            )
-
 
 class TestReadTemplate:
     """Tests for the _read_template function."""
 
-    def test_successful_template_read(self):
+    @pytest.fixture(autouse=True)
+    def _clear_template_cache(self):
+        """Ensure each test starts (and leaves) with a cold template cache."""
+        _load_templates.cache_clear()
+        yield
+        _load_templates.cache_clear()
+
+    def test_successful_template_read(self, console):
         """Test successfully reading a template file."""
         # Arrange
         template_name = "test_template.txt"
         template_content = "Template content"
-        console = MagicMock(spec=Console)
 
         # Act
         with patch("importlib.resources.files") as mock_files:
+            mock_entry = MagicMock()
+            mock_entry.name = template_name
+            mock_entry.read_text.return_value = template_content
             mock_path = MagicMock()
             mock_files.return_value = mock_path
             mock_path.__truediv__.return_value = mock_path
-            mock_path.read_text.return_value = template_content
+            mock_path.iterdir.return_value = [mock_entry]
 
             result = _read_template(template_name, console)
 
         # Assert
         assert result == template_content
-        mock_path.read_text.assert_called_once()
+        mock_entry.read_text.assert_called_once()
 
-    def test_template_not_found(self):
+    def test_template_not_found(self, console):
         """Test handling case when template is not found."""
         # Arrange
         template_name = "missing_template.txt"
-        console = MagicMock(spec=Console)
 
         # Act
         with patch("importlib.resources.files") as mock_files:
             mock_path = MagicMock()
             mock_files.return_value = mock_path
             mock_path.__truediv__.return_value = mock_path
-            mock_path.read_text.side_effect = FileNotFoundError("Template not found")
+            mock_path.iterdir.return_value = []
 
             result = _read_template(template_name, console)
 
         # Assert
         assert result is None
-        console.print.assert_called_with(
+        assert console.messages[-1] == (
             f"[bold red]Error:[/bold red] Could not read template '{template_name}'. Template not found"
         )
 
 
+class TestGitStatusPorcelain:
+    """Tests for the dulwich-backed fast path of _git_status_porcelain."""
+
+    @pytest.fixture(autouse=True)
+    def _require_dulwich(self):
+        """Skip when the optional dulwich dependency is not installed."""
+        pytest.importorskip("dulwich")
+
+    @pytest.fixture
+    def git_repo(self, tmp_path):
+        """An initialized repository with one committed file."""
+        from dulwich import porcelain
+
+        porcelain.init(str(tmp_path))
+        (tmp_path / "tracked.txt").write_text("content")
+        porcelain.add(str(tmp_path), [str(tmp_path / "tracked.txt")])
+        porcelain.commit(
+            str(tmp_path),
+            message=b"initial",
+            author=b"Test <test@example.com>",
+            committer=b"Test <test@example.com>",
+        )
+        return tmp_path
+
+    def test_clean_repository(self, git_repo, console):
+        """Test that a repository with no pending changes reports clean."""
+        success, output = _git_status_porcelain(git_repo, console)
+
+        assert success is True
+        assert output == ""
+
+    def test_dirty_repository(self, git_repo, console):
+        """Test that an untracked file makes the repository report dirty."""
+        (git_repo / "untracked.txt").write_text("new")
+
+        success, output = _git_status_porcelain(git_repo, console)
+
+        assert success is True
+        assert output == "dirty"
+
+    def test_status_from_subdirectory(self, git_repo, console):
+        """Test that the repository is discovered from a subdirectory."""
+        subdir = git_repo / "src"
+        subdir.mkdir()
+
+        success, _output = _git_status_porcelain(subdir, console)
+
+        assert success is True
+
+    def test_not_a_repository(self, tmp_path, console):
+        """Test the no-repository outcome."""
+        success, output = _git_status_porcelain(tmp_path, console)
+
+        assert success is False
+        assert output is None
+
+    def test_dulwich_error_falls_back_to_subprocess(
+        self, git_repo, console, monkeypatch
+    ):
+        """Test that unexpected dulwich errors degrade to the git subprocess."""
+        # Arrange
+        fallback = MagicMock(return_value=(True, ""))
+        monkeypatch.setattr(main, "_run_command", fallback)
+        monkeypatch.setattr(
+            "dulwich.porcelain.status", MagicMock(side_effect=RuntimeError("boom"))
+        )
+
+        # Act
+        success, _output = _git_status_porcelain(git_repo, console)
+
+        # Assert
+        assert success is True
+        fallback.assert_called_once()
+
+
 class TestRunCommand:
     """Tests for the _run_command function."""
 
-    def test_successful_command_with_capture(self, tmp_path):
+    def test_successful_command_with_capture(self, tmp_path, console):
         """Test running a command successfully with output capture."""
         # Arrange
         command = ["echo", "test"]
         cwd = tmp_path
-        console = MagicMock(spec=Console)
 
         # Act
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = "test output"
-            mock_run.return_value = mock_result
+        with patch("subprocess.Popen") as mock_popen:
+            mock_process = MagicMock()
+            mock_process.stdout = iter([b"test output"])
+            mock_process.wait.return_value = 0
+            mock_popen.return_value = mock_process
 
             success, output = _run_command(command, cwd, console)
 
         # Assert
         assert success is True
         assert output == "test output"
-        mock_run.assert_called_with(
-            command, cwd=cwd, check=True, text=True, capture_output=True
+        mock_popen.assert_called_with(
+            command,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
         )
 
-    def test_successful_command_without_capture(self, tmp_path):
+    def test_capture_keeps_only_output_tail(self, tmp_path, console):
+        """Test that captured output is bounded to the most recent lines."""
+        # Arrange
+        command = ["noisy_command"]
+        cwd = tmp_path
+        lines = [f"line {i}\n".encode() for i in range(500)]
+
+        # Act
+        with patch("subprocess.Popen") as mock_popen:
+            mock_process = MagicMock()
+            mock_process.stdout = iter(lines)
+            mock_process.wait.return_value = 0
+            mock_popen.return_value = mock_process
+
+            success, output = _run_command(command, cwd, console)
+
+        # Assert
+        assert success is True
+        assert output is not None
+        assert "line 499\n" in output
+        assert "line 0\n" not in output  # early lines dropped from the buffer
+
+    def test_successful_command_without_capture(self, tmp_path, console):
         """Test running a command successfully without output capture."""
         # Arrange
         command = ["echo", "test"]
         cwd = tmp_path
-        console = MagicMock(spec=Console)
 
         # Act
         with patch("subprocess.run") as mock_run:
@@ -256,24 +335,23 @@ class TestRunCommand:
         # Assert
         assert success is True
         assert output is None
-        mock_run.assert_called_with(command, cwd=cwd, check=True, text=True)
+        mock_run.assert_called_with(command, cwd=cwd, check=True)
 
-    def test_command_failure(self, tmp_path):
+    def test_command_failure(self, tmp_path, console):
         """Test handling a command that fails."""
         # Arrange
         command = ["ls", "--invalid-option"]
         cwd = tmp_path
-        console = MagicMock(spec=Console)
 
         # Act
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.SubprocessError("Command failed")
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.side_effect = subprocess.SubprocessError("Command failed")
 
             success, output = _run_command(command, cwd, console)
 
         # Assert
         assert success is False
         assert output is None
-        console.print.assert_called_with(
+        assert console.messages[-1] == (
             "[bold red]Command Error:[/bold red] ls --invalid-option failed with Command failed"
         )